@@ -1,5 +1,10 @@
 import asyncio
+import itertools
 import os
+import time
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import AsyncIterator
 
 import discord
 from discord import app_commands
@@ -26,9 +31,10 @@ if not discord.opus.is_loaded():
 from src.clients.spotify_scraper import SpotifyScraperClient
 from src.clients.youtube import YouTubeClient
 from src.clients.ytmusic import YTMusicClient
+from src.models.track import Track
 from src.music.player import PlayerManager
-from src.music.queue import QueueManager
-from src.resolver import Resolver
+from src.music.queue import QueueFullError, QueueManager
+from src.resolver import InputType, Resolver
 from src.ui.embeds import (
     added_to_queue_embed,
     error_embed,
@@ -39,6 +45,19 @@ from src.ui.embeds import (
 
 load_dotenv()
 
+PLAYLIST_RESOLVE_CONCURRENCY = 16  # Parallel YouTube lookups per Spotify playlist
+PLAYLIST_PROGRESS_BATCH_SIZE = 20  # Report queued playlist tracks in batches of this size...
+PLAYLIST_PROGRESS_INTERVAL_SECONDS = 2.0  # ...or at least this often
+
+
+def _report_task_exception(task: asyncio.Task) -> None:
+    """Done callback: surface exceptions from background tasks instead of dropping them."""
+    if task.cancelled():
+        return
+    error = task.exception()
+    if error:
+        print(f"Background task {task.get_name()} failed: {error!r}")
+
 
 class MusicBot(discord.Client):
     def __init__(self):
@@ -53,17 +72,44 @@ class MusicBot(discord.Client):
         self.youtube = YouTubeClient()
         self.spotify = SpotifyScraperClient()
 
+        # Blocking resolver work gets its own pool so it can't starve the default executor
+        self._resolve_executor = ThreadPoolExecutor(
+            max_workers=32, thread_name_prefix="resolve"
+        )
+
         # Create resolver with all clients
         self.resolver = Resolver(
             ytmusic=self.ytmusic,
             youtube=self.youtube,
             spotify=self.spotify,
+            executor=self._resolve_executor,
         )
 
         self.queues = QueueManager()
         self.players = PlayerManager(self.youtube)
 
+        # Strong refs to fire-and-forget tasks; the event loop only keeps weak ones
+        self._background_tasks: set[asyncio.Task] = set()
+
+    def create_background_task(self, coro) -> asyncio.Task:
+        """Schedule a coroutine that outlives its caller, keeping it referenced until done."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        task.add_done_callback(_report_task_exception)
+        return task
+
+    async def close(self):
+        for task in self._background_tasks:
+            task.cancel()
+        await super().close()
+        self._resolve_executor.shutdown(wait=False, cancel_futures=True)
+        self.youtube.close()
+        self.spotify.close()
+
     async def setup_hook(self):
+        self.create_background_task(self.players.sweep_forever())
+
         # Guild-specific sync is instant; global sync can take up to an hour
         test_guild_id = os.getenv("TEST_GUILD_ID")
         if test_guild_id:
@@ -97,50 +143,123 @@ async def ensure_voice(interaction: discord.Interaction) -> discord.VoiceClient
     return voice_client
 
 
+async def _iter_youtube_playlist(
+    resolver: Resolver, url: str, executor: Executor
+) -> AsyncIterator[Track]:
+    """Yield YouTube playlist tracks, pulling each one from the blocking iterator in a thread."""
+    loop = asyncio.get_running_loop()
+    iterator = resolver.iter_youtube_playlist(url)
+
+    # Wrap blocking next() call to run in thread pool
+    def get_next_track():
+        try:
+            return next(iterator)
+        except StopIteration:
+            return None
+
+    while True:
+        # Run blocking I/O in thread so event loop stays responsive
+        track = await loop.run_in_executor(executor, get_next_track)
+        if track is None:
+            return
+        yield track
+
+
+async def _iter_spotify_playlist(
+    resolver: Resolver, url: str, executor: Executor
+) -> AsyncIterator[Track]:
+    """Yield Spotify playlist tracks in playlist order, resolving ahead in parallel.
+
+    Each track needs its own YouTube Music search, so up to
+    PLAYLIST_RESOLVE_CONCURRENCY lookups run at once in a sliding window;
+    the oldest is yielded as soon as it's done and the next one is started.
+    """
+    loop = asyncio.get_running_loop()
+    track_infos = await loop.run_in_executor(
+        executor, lambda: list(resolver.iter_spotify_playlist_info(url))
+    )
+
+    def resolve(track_info: dict) -> asyncio.Future:
+        return loop.run_in_executor(
+            executor, resolver.spotify_track_info_to_track, track_info, url
+        )
+
+    pending = iter(track_infos)
+    # Strong refs to in-flight lookups, oldest first
+    window = deque(
+        resolve(info) for info in itertools.islice(pending, PLAYLIST_RESOLVE_CONCURRENCY)
+    )
+    try:
+        while window:
+            lookup = window.popleft()
+            next_info = next(pending, None)
+            if next_info is not None:
+                window.append(resolve(next_info))
+            try:
+                track = await lookup
+            except ValueError:
+                continue  # Skip tracks that can't be resolved
+            yield track
+    finally:
+        for lookup in window:
+            lookup.cancel()
+
+
 async def _stream_playlist_to_queue(
     resolver: Resolver,
     playlist_type: str,  # "spotify" or "youtube"
     url: str,
+    executor: Executor,
     queue,
     player,
     requested_by: str,
     interaction: discord.Interaction,
 ):
     """Background task: resolve playlist tracks and add to queue as they resolve."""
-    iterator = (
-        resolver.iter_spotify_playlist(url)
+    tracks = (
+        _iter_spotify_playlist(resolver, url, executor)
         if playlist_type == "spotify"
-        else resolver.iter_youtube_playlist(url)
+        else _iter_youtube_playlist(resolver, url, executor)
     )
 
-    tracks_added = []
+    # Report progress in batches rather than one summary after the whole playlist
+    batch: list[Track] = []
+    offset = 0
+    last_flush = time.monotonic()
     first_track = True
 
-    # Wrap blocking next() call to run in thread pool
-    def get_next_track():
-        try:
-            return next(iterator)
-        except StopIteration:
-            return None
-
-    while True:
-        # Run blocking I/O in thread so event loop stays responsive
-        track = await asyncio.to_thread(get_next_track)
-        if track is None:
-            break
+    async def flush():
+        nonlocal batch, offset, last_flush
+        await interaction.followup.send(embed=playlist_added_embed(batch, offset=offset))
+        offset += len(batch)
+        batch = []
+        last_flush = time.monotonic()
 
+    async for track in tracks:
         track.requested_by = requested_by
-        queue.add(track)
-        tracks_added.append(track)
+        try:
+            queue.add(track)
+        except QueueFullError as e:
+            await tracks.aclose()
+            if batch:
+                await flush()
+            await interaction.followup.send(embed=error_embed(f"{e} Stopped adding playlist tracks."))
+            return
+        batch.append(track)
 
         # Start playing on first track
         if first_track and not player.is_playing():
             await player.play_next()
             first_track = False
 
-    # Send summary when done
-    if tracks_added:
-        await interaction.followup.send(embed=playlist_added_embed(tracks_added, 0))
+        if (
+            len(batch) >= PLAYLIST_PROGRESS_BATCH_SIZE
+            or time.monotonic() - last_flush >= PLAYLIST_PROGRESS_INTERVAL_SECONDS
+        ):
+            await flush()
+
+    if batch:
+        await flush()
 
 
 @bot.tree.command(name="play", description="Play a song from a search query or URL")
@@ -174,14 +293,16 @@ async def play(interaction: discord.Interaction, query: str):
         return player
 
     # Detect playlist URLs and stream them
-    if "open.spotify.com/playlist" in query or "spotify:playlist:" in query:
+    input_type = bot.resolver.detect_input_type(query)
+    if input_type == InputType.SPOTIFY_PLAYLIST:
         player = get_or_create_player()
         await interaction.followup.send("Loading Spotify playlist...")
-        asyncio.create_task(
+        bot.create_background_task(
             _stream_playlist_to_queue(
                 bot.resolver,
                 "spotify",
                 query,
+                bot._resolve_executor,
                 queue,
                 player,
                 interaction.user.display_name,
@@ -190,14 +311,15 @@ async def play(interaction: discord.Interaction, query: str):
         )
         return
 
-    if "youtube.com/playlist" in query:
+    if input_type == InputType.YOUTUBE_PLAYLIST:
         player = get_or_create_player()
         await interaction.followup.send("Loading YouTube playlist...")
-        asyncio.create_task(
+        bot.create_background_task(
             _stream_playlist_to_queue(
                 bot.resolver,
                 "youtube",
                 query,
+                bot._resolve_executor,
                 queue,
                 player,
                 interaction.user.display_name,
@@ -208,7 +330,7 @@ async def play(interaction: discord.Interaction, query: str):
 
     # Resolve the query to track(s)
     try:
-        tracks = bot.resolver.resolve(query)
+        tracks = await bot.resolver.aresolve(query)
     except NotImplementedError as e:
         await interaction.followup.send(embed=error_embed(str(e)))
         return
@@ -223,7 +345,11 @@ async def play(interaction: discord.Interaction, query: str):
     first_position = None
     for track in tracks:
         track.requested_by = interaction.user.display_name
-        position = queue.add(track)
+        try:
+            position = queue.add(track)
+        except QueueFullError as e:
+            await interaction.followup.send(embed=error_embed(str(e)))
+            return
         if first_position is None:
             first_position = position
 
@@ -1,7 +1,12 @@
+import asyncio
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 import yt_dlp
 
+from src.cache import TTLCache
 from src.models.track import TrackMetadata
 
 
@@ -18,12 +23,99 @@ class YouTubeClient:
         "quiet": True,
         "no_warnings": True,
         "extract_flat": False,
+        # Browser cookies for YouTube auth, loaded once per YoutubeDL instance
+        "cookiesfrombrowser": ("firefox",),
+        "remote_components": ["ejs:github"],
+    }
+
+    # Flat extraction: list playlist entries without resolving each video
+    YTDL_FLAT_OPTIONS = {
+        "extract_flat": "in_playlist",
+        "quiet": True,
+        "no_warnings": True,
+        "ignoreerrors": True,
     }
 
     DURATION_TOLERANCE = 0.10  # 10% tolerance for duration matching
+    INFO_CACHE_TTL_SECONDS = 300  # Stream URLs expire after ~6 hours, so this is safe
+    INFO_CACHE_SIZE = 256
+    INFO_CACHE_FIELDS = ("title", "uploader", "channel", "duration", "thumbnail")
+    MAX_WORKERS = 4  # Threads backing the async methods
 
     def __init__(self):
-        self._ytdl = yt_dlp.YoutubeDL(self.YTDL_OPTIONS)
+        # YoutubeDL isn't thread-safe, and both this client's pool and the resolver's
+        # call in, so each thread lazily gets its own instances
+        self._local = threading.local()
+        self._instances: list[yt_dlp.YoutubeDL] = []
+        self._instances_lock = threading.Lock()
+        self._info_cache: TTLCache[str, dict] = TTLCache(
+            self.INFO_CACHE_TTL_SECONDS, maxsize=self.INFO_CACHE_SIZE
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.MAX_WORKERS, thread_name_prefix="youtube"
+        )
+
+    def _get_ytdl(self, flat: bool = False) -> yt_dlp.YoutubeDL:
+        """Return the calling thread's YoutubeDL, creating it on first use."""
+        name = "ytdl_flat" if flat else "ytdl"
+        ytdl = getattr(self._local, name, None)
+        if ytdl is None:
+            ytdl = yt_dlp.YoutubeDL(self.YTDL_FLAT_OPTIONS if flat else self.YTDL_OPTIONS)
+            setattr(self._local, name, ytdl)
+            with self._instances_lock:
+                self._instances.append(ytdl)
+        return ytdl
+
+    async def _run(self, func, *args):
+        """Run a blocking method on this client's own thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _get_info(self, video_url: str) -> dict:
+        """
+        Extract video info, reusing a recent extraction of the same URL.
+        Returns INFO_CACHE_FIELDS plus "audio", the AudioSource to play (or None).
+        Raises yt_dlp.DownloadError if the video cannot be loaded.
+        """
+        info = self._info_cache.get(video_url)
+        if info is None:
+            full = self._get_ytdl().extract_info(video_url, download=False)
+            # The full dict lists every format, caption track and thumbnail; keep
+            # only what callers read, with the audio stream already picked
+            info = {field: full.get(field) for field in self.INFO_CACHE_FIELDS}
+            info["audio"] = self._select_audio(full)
+            self._info_cache.set(video_url, info)
+        return info
+
+    @staticmethod
+    def _select_audio(info: dict) -> AudioSource | None:
+        """Pick the audio stream (URL + headers) to play from a full extract_info dict."""
+        # Get HTTP headers needed for the request
+        http_headers = info.get("http_headers", {})
+
+        # Get the best audio format URL
+        formats = info.get("formats", [])
+        audio_formats = [f for f in formats if f.get("acodec") != "none" and f.get("vcodec") == "none"]
+
+        url = None
+        if audio_formats:
+            # Prefer opus for Discord compatibility; formats are listed worst first,
+            # so take the highest bitrate rather than the first
+            opus = [f for f in audio_formats if "opus" in f.get("acodec", "").lower()]
+            best = max(opus or audio_formats, key=lambda f: f.get("abr") or 0)
+            url = best.get("url")
+            http_headers = best.get("http_headers", http_headers)
+        else:
+            url = info.get("url")
+
+        if not url:
+            return None
+
+        return AudioSource(url=url, http_headers=http_headers)
+
+    def invalidate(self, video_url: str) -> None:
+        """Forget cached info for a video, e.g. after its stream URL failed."""
+        self._info_cache.invalidate(video_url)
 
     def search_video(self, query: str, target_duration_ms: int = 0) -> str | None:
         """
@@ -33,7 +125,7 @@ class YouTubeClient:
         """
         search_query = f"ytsearch5:{query}"
         try:
-            result = self._ytdl.extract_info(search_query, download=False)
+            result = self._get_ytdl().extract_info(search_query, download=False)
         except yt_dlp.DownloadError:
             return None
 
@@ -48,20 +140,13 @@ class YouTubeClient:
         target_seconds = target_duration_ms / 1000
         tolerance = target_seconds * self.DURATION_TOLERANCE
 
-        # Find best match by duration
-        best_match = None
-        best_diff = float("inf")
-
-        for entry in entries:
-            if not entry:
-                continue
-            duration = entry.get("duration", 0)
-            diff = abs(duration - target_seconds)
-            if diff <= tolerance and diff < best_diff:
-                best_diff = diff
-                best_match = entry
+        def duration_diff(entry: dict) -> float:
+            return abs((entry.get("duration") or 0) - target_seconds)
 
-        if best_match:
+        # Find best match by duration among results within tolerance
+        candidates = [e for e in entries if e and duration_diff(e) <= tolerance]
+        if candidates:
+            best_match = min(candidates, key=duration_diff)
             return best_match.get("webpage_url") or best_match.get("url")
 
         # If no duration match, return first result as fallback
@@ -73,39 +158,18 @@ class YouTubeClient:
         Call this right before playback - URLs expire after ~6 hours.
         """
         try:
-            info = self._ytdl.extract_info(video_url, download=False)
+            return self._get_info(video_url)["audio"]
         except yt_dlp.DownloadError:
             return None
 
-        # Get HTTP headers needed for the request
-        http_headers = info.get("http_headers", {})
-
-        # Get the best audio format URL
-        formats = info.get("formats", [])
-        audio_formats = [f for f in formats if f.get("acodec") != "none" and f.get("vcodec") == "none"]
-
-        url = None
-        if audio_formats:
-            # Prefer opus for Discord compatibility
-            opus = [f for f in audio_formats if "opus" in f.get("acodec", "").lower()]
-            if opus:
-                url = opus[0].get("url")
-                http_headers = opus[0].get("http_headers", http_headers)
-            else:
-                url = audio_formats[0].get("url")
-                http_headers = audio_formats[0].get("http_headers", http_headers)
-        else:
-            url = info.get("url")
-
-        if not url:
-            return None
-
-        return AudioSource(url=url, http_headers=http_headers)
+    async def aget_audio_source(self, video_url: str) -> AudioSource | None:
+        """Async version of get_audio_source()."""
+        return await self._run(self.get_audio_source, video_url)
 
     def get_video_title(self, video_url: str) -> str | None:
         """Get the title of a YouTube video."""
         try:
-            info = self._ytdl.extract_info(video_url, download=False)
+            info = self._get_info(video_url)
             return info.get("title")
         except yt_dlp.DownloadError:
             return None
@@ -113,9 +177,10 @@ class YouTubeClient:
     def get_video_metadata(self, video_url: str) -> TrackMetadata | None:
         """Get metadata from a YouTube video."""
         try:
-            info = self._ytdl.extract_info(video_url, download=False)
-            title = info.get("title", "Unknown")
-            artist = info.get("uploader", info.get("channel", "Unknown"))
+            info = self._get_info(video_url)
+            # Interned: playlists repeat the same uploaders many times
+            title = sys.intern(info.get("title") or "Unknown")
+            artist = sys.intern(info.get("uploader") or info.get("channel") or "Unknown")
             duration_ms = (info.get("duration") or 0) * 1000
             thumbnail = info.get("thumbnail")
 
@@ -131,17 +196,10 @@ class YouTubeClient:
 
     def get_playlist_entries(self, url: str) -> list[dict]:
         """Get video entries from YouTube playlist using flat extraction."""
-        opts = {
-            "extract_flat": "in_playlist",
-            "quiet": True,
-            "no_warnings": True,
-            "ignoreerrors": True,
-        }
-        with yt_dlp.YoutubeDL(opts) as ytdl:
-            try:
-                result = ytdl.extract_info(url, download=False)
-            except Exception:
-                return []
+        try:
+            result = self._get_ytdl(flat=True).extract_info(url, download=False)
+        except Exception:
+            return []
 
         entries = result.get("entries", []) if result else []
         return [
@@ -153,3 +211,11 @@ class YouTubeClient:
             for e in entries
             if e and e.get("id")
         ]
+
+    def close(self):
+        """Close the thread pool and the underlying yt-dlp instances."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._instances_lock:
+            instances, self._instances = self._instances, []
+        for ytdl in instances:
+            ytdl.close()
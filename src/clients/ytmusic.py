@@ -1,14 +1,23 @@
+import sys
+
 from ytmusicapi import YTMusic
 
+from src.cache import TTLCache
 from src.models.track import TrackMetadata
 
 
 class YTMusicClient:
     """YouTube Music client for searching tracks."""
 
+    SEARCH_CACHE_TTL_SECONDS = 30 * 60
+    SEARCH_CACHE_SIZE = 4096
+
     def __init__(self):
         self._client = YTMusic()  # No auth needed for search
         self._available = True
+        self._search_cache: TTLCache[str, tuple[TrackMetadata, str]] = TTLCache(
+            self.SEARCH_CACHE_TTL_SECONDS, maxsize=self.SEARCH_CACHE_SIZE
+        )
 
     @property
     def available(self) -> bool:
@@ -18,7 +27,18 @@ class YTMusicClient:
         """
         Search YouTube Music for a track.
         Returns (metadata, video_id) tuple or None if not found.
+        Repeated searches for the same query are served from a cache.
         """
+        key = query.casefold().strip()
+        result = self._search_cache.get(key)
+        if result is None:
+            result = self._search(query)
+            if result:
+                self._search_cache.set(key, result)
+        return result
+
+    def _search(self, query: str) -> tuple[TrackMetadata, str] | None:
+        """Uncached search_track()."""
         try:
             results = self._client.search(query, filter="songs", limit=1)
             if not results:
@@ -41,8 +61,9 @@ class YTMusicClient:
             duration_seconds = track.get("duration_seconds", 0)
 
             metadata = TrackMetadata(
-                title=track.get("title", "Unknown"),
-                artist=artist_str or "Unknown",
+                # Interned: playlists repeat the same artists many times
+                title=sys.intern(track.get("title") or "Unknown"),
+                artist=sys.intern(artist_str or "Unknown"),
                 duration_ms=duration_seconds * 1000,
                 album_art_url=album_art,
                 source_url=f"https://music.youtube.com/watch?v={video_id}",
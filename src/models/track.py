@@ -1,7 +1,7 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TrackMetadata:
     """Metadata for a track. Provider-agnostic intermediate representation."""
 
@@ -12,7 +12,7 @@ class TrackMetadata:
     source_url: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class Track:
     """A track ready to be queued and played."""
 
@@ -23,11 +23,22 @@ class Track:
     youtube_url: str  # Ready to play
     source_url: str | None  # Original URL (Spotify/YTMusic link)
     requested_by: str | None = None  # Set when queueing
+    source_label: str = "Source"  # Link text for source_url, set by the resolver
+    _duration_str: str | None = field(default=None, init=False, repr=False, compare=False)
+    _queue_line: str | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def duration_str(self) -> str:
         """Format duration as MM:SS"""
-        total_seconds = self.duration_ms // 1000
-        minutes = total_seconds // 60
-        seconds = total_seconds % 60
-        return f"{minutes}:{seconds:02d}"
+        # duration_ms never changes after construction, so format it once
+        if self._duration_str is None:
+            minutes, seconds = divmod(self.duration_ms // 1000, 60)
+            self._duration_str = f"{minutes}:{seconds:02d}"
+        return self._duration_str
+
+    @property
+    def queue_line(self) -> str:
+        """Format as a queue entry: **title** by artist [MM:SS]"""
+        if self._queue_line is None:
+            self._queue_line = f"**{self.title}** by {self.artist} [{self.duration_str}]"
+        return self._queue_line
@@ -1,52 +1,200 @@
 import asyncio
-import queue
+import os
 import shutil
 import subprocess
 import threading
-from typing import Callable
+import weakref
+from typing import TYPE_CHECKING, Callable, Literal
 
 import discord
 
-from src.clients.youtube import YouTubeClient
-from src.models.track import Track
-from src.music.queue import GuildQueue
 from src.ui.embeds import now_playing_embed
 
+# Only used in annotations, which aren't evaluated at import time
+if TYPE_CHECKING:
+    from src.clients.youtube import AudioSource, YouTubeClient
+    from src.models.track import Track
+    from src.music.queue import GuildQueue
+
+try:
+    import av  # Optional: decode in-process with PyAV instead of an ffmpeg subprocess
+except ImportError:
+    av = None
+
 
 IDLE_TIMEOUT_SECONDS = 120  # 2 minutes
+PREFETCH_LEAD_SECONDS = 10  # Start decoding the next track this long before the current one ends
 
 # Audio constants
 FRAME_SIZE = 3840  # 20ms of 48kHz stereo 16-bit audio (48000 * 2 * 2 * 0.02)
 FRAMES_PER_SECOND = 50
+FRAMES_PER_READ = 16  # Read buffer in frames; ~60 KiB, just under a Linux pipe's capacity
+_SILENCE_FRAME = b"\x00" * FRAME_SIZE  # Returned on buffer underrun
+_END_OF_STREAM = b""  # Returned once the stream is drained; stops discord.py's player
 
 # Buffer configuration
 AUDIO_BUFFER_SECONDS = 5.0  # Max buffer size
 AUDIO_PREBUFFER_SECONDS = 2.0  # Wait for this much audio before starting playback
 
+# Admission control: cap decoders (ffmpeg processes) running at once across all guilds
+MAX_CONCURRENT_DECODERS = 32
+_decoder_slots = threading.BoundedSemaphore(MAX_CONCURRENT_DECODERS)
+# A full buffer that was never read from in this long gives up its decoder and slot
+STALLED_SOURCE_TIMEOUT_SECONDS = 15 * 60
+
+
+def _header_lines(audio: AudioSource) -> str:
+    """Format HTTP headers the way libav's `headers` option expects them."""
+    return "".join(f"{name}: {value}\r\n" for name, value in audio.http_headers.items())
+
+
+class _FFmpegDecoder:
+    """Decodes a stream URL to 48kHz stereo s16le PCM in an ffmpeg subprocess."""
+
+    def __init__(self, audio: AudioSource):
+        ffmpeg_path = shutil.which("ffmpeg") or "ffmpeg"
+
+        self._process = subprocess.Popen(
+            [
+                ffmpeg_path,
+                "-headers", _header_lines(audio),
+                "-reconnect", "1",
+                "-reconnect_streamed", "1",
+                "-reconnect_delay_max", "5",
+                # Output is fixed raw PCM, so skip the multi-second input probe
+                "-analyzeduration", "0",
+                "-probesize", "32",
+                "-fflags", "+nobuffer+discardcorrupt",
+                "-flags", "low_delay",
+                "-i", audio.url,
+                "-f", "s16le",
+                "-ar", "48000",
+                "-ac", "2",
+                "-loglevel", "quiet",
+                "pipe:1",
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,  # Read the pipe directly; BufferedReader would copy every frame twice
+        )
+        self._fd = self._process.stdout.fileno()
+
+    def readinto(self, buffer: memoryview) -> int:
+        """Read whatever PCM the pipe has, up to len(buffer). Returns 0 at EOF."""
+        return os.readinto(self._fd, buffer)
+
+    def interrupt(self) -> None:
+        """Unblock a pending readinto() from another thread."""
+        self._process.kill()
+
+    def close(self) -> None:
+        self._process.kill()
+        self._process.wait()
+
+
+class _PyAVDecoder:
+    """Decodes a stream URL to 48kHz stereo s16le PCM in-process with PyAV.
+
+    Avoids a subprocess and a pipe per stream. libav objects aren't safe to touch
+    from another thread mid-decode, so interrupt() is a no-op and blocked reads
+    are bounded by READ_TIMEOUT_SECONDS instead.
+    """
+
+    OPEN_TIMEOUT_SECONDS = 10
+    READ_TIMEOUT_SECONDS = 5
+
+    def __init__(self, audio: AudioSource):
+        self._container = av.open(
+            audio.url,
+            options={
+                "headers": _header_lines(audio),
+                "reconnect": "1",
+                "reconnect_streamed": "1",
+                "reconnect_delay_max": "5",
+                "analyzeduration": "0",
+                "probesize": "32",
+                "fflags": "+nobuffer+discardcorrupt",
+                "flags": "low_delay",
+            },
+            timeout=(self.OPEN_TIMEOUT_SECONDS, self.READ_TIMEOUT_SECONDS),
+        )
+        self._resampler = av.AudioResampler(format="s16", layout="stereo", rate=48000)
+        self._pcm = self._iter_pcm()
+        self._pending = memoryview(b"")
+
+    def _iter_pcm(self):
+        """Yield packed PCM buffers, one per resampled frame."""
+        try:
+            for frame in self._container.decode(audio=0):
+                for resampled in self._resampler.resample(frame):
+                    yield self._frame_bytes(resampled)
+            for resampled in self._resampler.resample(None):  # Flush
+                yield self._frame_bytes(resampled)
+        except av.FFmpegError:
+            return  # Treat decode/network errors as end of stream
+
+    @staticmethod
+    def _frame_bytes(frame) -> memoryview:
+        # Packed s16 stereo: one plane, 4 bytes per sample; the plane may be padded
+        return memoryview(frame.planes[0])[: frame.samples * 4]
+
+    def readinto(self, buffer: memoryview) -> int:
+        """Fill buffer with PCM. Returns bytes read; 0 at EOF."""
+        view = memoryview(buffer)
+        filled = 0
+        while filled < len(view):
+            if not self._pending:
+                self._pending = next(self._pcm, None)
+                if self._pending is None:
+                    self._pending = memoryview(b"")
+                    break
+            size = min(len(self._pending), len(view) - filled)
+            view[filled:filled + size] = self._pending[:size]
+            self._pending = self._pending[size:]
+            filled += size
+        return filled
+
+    def interrupt(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self._container.close()
+
 
 class YTDLPAudioSource(discord.AudioSource):
-    """Audio source that streams from YouTube via yt-dlp with buffering.
+    """Audio source that decodes a resolved YouTube stream URL, with buffering.
 
-    Uses a background thread to continuously read from ffmpeg into a thread-safe
-    buffer, isolating Discord's read() calls from network jitter.
+    The stream URL comes from YouTubeClient.get_audio_source(), so yt-dlp only runs
+    in-process. Decoding happens in-process with PyAV when it's installed, and in an
+    ffmpeg subprocess otherwise. Uses a background thread to continuously read PCM
+    into a ring buffer of fixed-size frames, isolating Discord's read() calls from
+    network jitter.
     """
 
     def __init__(
         self,
-        youtube_url: str,
+        audio: AudioSource,
         buffer_seconds: float = AUDIO_BUFFER_SECONDS,
         prebuffer_seconds: float = AUDIO_PREBUFFER_SECONDS,
     ):
-        self.youtube_url = youtube_url
-        self._process: subprocess.Popen | None = None
-        self._ffmpeg: subprocess.Popen | None = None
+        self.audio = audio
+        self.error: Exception | None = None  # Set if the stream failed to open or decode
+        self.stalled = False  # Set if decoding gave up because nothing ever read
+        self._started = False  # Set on the first read(), i.e. once discord.py plays it
+        self._decoder: _FFmpegDecoder | _PyAVDecoder | None = None
 
         # Buffer configuration
         self._buffer_frames = int(buffer_seconds * FRAMES_PER_SECOND)
         self._prebuffer_frames = int(prebuffer_seconds * FRAMES_PER_SECOND)
 
-        # Thread-safe buffer
-        self._buffer: queue.Queue[bytes] = queue.Queue(maxsize=self._buffer_frames)
+        # Ring buffer of PCM frames; head/tail are frame indices, guarded by _cv
+        self._ring = bytearray(self._buffer_frames * FRAME_SIZE)
+        self._ring_view = memoryview(self._ring)
+        self._head = 0  # Next frame to read
+        self._tail = 0  # Next frame to write
+        self._count = 0  # Frames currently buffered
+        self._cv = threading.Condition()
         self._buffer_thread: threading.Thread | None = None
         self._stop_event = threading.Event()
         self._prebuffer_ready = threading.Event()
@@ -57,104 +205,148 @@ class YTDLPAudioSource(discord.AudioSource):
 
     def _start_buffering(self):
         """Start the background buffering thread."""
-        self._spawn_processes()
         self._buffer_thread = threading.Thread(target=self._buffer_loop, daemon=True)
         self._buffer_thread.start()
 
-    def _spawn_processes(self):
-        """Spawn yt-dlp and ffmpeg processes."""
-        ytdlp_path = shutil.which("yt-dlp") or "yt-dlp"
-        ffmpeg_path = shutil.which("ffmpeg") or "ffmpeg"
+    def _buffer_loop(self):
+        """Background thread: open the decoder, then continuously read from it into buffer."""
+        # Wait for a decoder slot; read() returns silence in the meantime
+        while not _decoder_slots.acquire(timeout=1.0):
+            if self._stop_event.is_set():
+                self._finish()
+                return
 
-        # yt-dlp outputs audio to stdout, using browser cookies for YouTube auth
-        self._process = subprocess.Popen(
-            [
-                ytdlp_path,
-                "-f", "bestaudio/best",
-                "-o", "-",
-                "--quiet",
-                "--cookies-from-browser", "firefox",
-                "--remote-components", "ejs:github",
-                self.youtube_url,
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL,
-        )
+        try:
+            if self._stop_event.is_set():
+                self._finish()
+                return
 
-        # FFmpeg reads from yt-dlp's stdout and outputs PCM
-        self._ffmpeg = subprocess.Popen(
-            [
-                ffmpeg_path,
-                "-thread_queue_size", "4096",
-                "-analyzeduration", "2000000",
-                "-probesize", "2000000",
-                "-fflags", "+genpts+discardcorrupt",
-                "-i", "pipe:0",
-                "-f", "s16le",
-                "-ar", "48000",
-                "-ac", "2",
-                "-loglevel", "quiet",
-                "pipe:1",
-            ],
-            stdin=self._process.stdout,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL,
-        )
+            try:
+                # Opening may do network I/O, so it happens here rather than in __init__
+                decoder_cls = _PyAVDecoder if av is not None else _FFmpegDecoder
+                self._decoder = decoder_cls(self.audio)
+            except Exception as e:
+                self.error = e
+                self._finish()
+                return
 
-    def _buffer_loop(self):
-        """Background thread: continuously read from ffmpeg into buffer."""
+            try:
+                self._decode_loop()
+            except Exception as e:
+                # e.g. a failed pipe read or a PyAV error _iter_pcm doesn't catch
+                self.error = e
+            finally:
+                # Without EOF, read() would return silence forever and the track never ends
+                self._finish()
+                self._decoder.close()
+        finally:
+            _decoder_slots.release()
+
+    def _decode_loop(self):
         frames_buffered = 0
+        chunk = bytearray(FRAME_SIZE * FRAMES_PER_READ)
+        chunk_view = memoryview(chunk)
+        filled = 0  # Bytes of a partial frame carried over from the last read
 
         while not self._stop_event.is_set():
-            data = self._ffmpeg.stdout.read(FRAME_SIZE)
-
-            if len(data) < FRAME_SIZE:
-                # End of stream or error
-                self._eof = True
-                self._prebuffer_ready.set()  # Unblock read() if waiting
+            # One read takes whatever is available, so short reads are normal
+            size = self._decoder.readinto(chunk_view[filled:])
+            if size == 0:
+                # End of stream or error; zero-pad a trailing partial frame
+                if filled:
+                    chunk_view[filled:FRAME_SIZE] = bytes(FRAME_SIZE - filled)
+                    self._write_frames(chunk_view[:FRAME_SIZE])
+                self._finish()
                 break
 
-            try:
-                # Put frame in buffer (blocks if buffer is full, with timeout)
-                self._buffer.put(data, timeout=1.0)
-                frames_buffered += 1
+            filled += size
+            whole = filled - filled % FRAME_SIZE
+            if not self._write_frames(chunk_view[:whole]):
+                break
+            frames_buffered += whole // FRAME_SIZE
+
+            # Keep the partial frame at the front for the next read
+            chunk_view[:filled - whole] = chunk_view[whole:filled]
+            filled -= whole
+
+            # Signal when prebuffer is ready
+            if frames_buffered >= self._prebuffer_frames:
+                self._prebuffer_ready.set()
+
+    def _finish(self):
+        """Mark the stream as ended and wake any waiting reader."""
+        with self._cv:
+            self._eof = True
+            self._cv.notify()
+        self._prebuffer_ready.set()  # Unblock read() if waiting
+
+    def _write_frames(self, frames: memoryview) -> bool:
+        """Copy whole frames into the ring, waiting for space. Returns False if stopped."""
+        with self._cv:
+            for start in range(0, len(frames), FRAME_SIZE):
+                # Buffer full - wait for the consumer to drain a frame
+                while self._count == self._buffer_frames and not self._stop_event.is_set():
+                    # A playing source can sit paused indefinitely; only one that was
+                    # never handed to discord.py (e.g. dropped without cleanup()) times out
+                    timeout = None if self._started else STALLED_SOURCE_TIMEOUT_SECONDS
+                    if not self._cv.wait(timeout=timeout) and not self._started:
+                        # Free the decoder slot; the player discards stalled sources
+                        self.stalled = True
+                        self._eof = True
+                        return False
+                if self._stop_event.is_set():
+                    return False
+
+                offset = self._tail * FRAME_SIZE
+                self._ring_view[offset:offset + FRAME_SIZE] = frames[start:start + FRAME_SIZE]
+                self._tail = (self._tail + 1) % self._buffer_frames
+                self._count += 1
+                self._cv.notify()
+        return True
 
-                # Signal when prebuffer is ready
-                if frames_buffered == self._prebuffer_frames:
-                    self._prebuffer_ready.set()
+    def read(self) -> bytes:
+        """Read 20ms of audio from buffer.
 
-            except queue.Full:
-                # Buffer full - this means consumer is slower than producer
-                # In practice, shouldn't happen with proper buffer sizing
-                pass
+        Returns a fresh bytes copy: discord.py's Opus encoder casts the frame with
+        ctypes, which only accepts bytes, so a view over the ring can't be handed out.
+        """
+        self._started = True
 
-    def read(self) -> bytes:
-        """Read 20ms of audio from buffer."""
         # Wait for prebuffer on first read
         if not self._prebuffer_ready.is_set():
             self._prebuffer_ready.wait(timeout=10.0)
 
-        try:
-            return self._buffer.get(timeout=0.5)
-        except queue.Empty:
-            if self._eof:
-                return b""  # Signal end of stream
-            # Buffer underrun - return silence rather than speed up
-            return b"\x00" * FRAME_SIZE
+        with self._cv:
+            if not self._count and not self._eof:
+                self._cv.wait(timeout=0.5)
+
+            if not self._count:
+                if self._eof:
+                    return _END_OF_STREAM
+                # Buffer underrun - return silence rather than speed up
+                return _SILENCE_FRAME
+
+            offset = self._head * FRAME_SIZE
+            frame = bytes(self._ring_view[offset:offset + FRAME_SIZE])
+            self._head = (self._head + 1) % self._buffer_frames
+            self._count -= 1
+            self._cv.notify()
+
+        return frame
 
     def cleanup(self):
-        """Clean up processes and threads."""
-        self._stop_event.set()
+        """Stop decoding. Doesn't wait: the buffer thread closes the decoder and frees
+        its slot on its way out.
 
-        if self._buffer_thread and self._buffer_thread.is_alive():
-            self._buffer_thread.join(timeout=2.0)
+        The player calls this from the event loop, and the thread can be blocked in
+        a slot wait, av.open() or a PyAV read that interrupt() can't cut short.
+        """
+        self._stop_event.set()
+        with self._cv:
+            self._cv.notify_all()  # Wake the buffer thread if it's waiting for space
 
-        if self._ffmpeg:
-            self._ffmpeg.kill()
-            self._ffmpeg = None
-        if self._process:
-            self._process.kill()
-            self._process = None
+        if self._decoder:
+            self._decoder.interrupt()
 
 
 class Player:
@@ -175,48 +367,196 @@ class Player:
         self.text_channel = text_channel
         self.on_track_start = on_track_start
         self.on_disconnect = on_disconnect
-        self._idle_task: asyncio.Task | None = None
+        self._idle_handle: asyncio.TimerHandle | None = None
+        self._idle_task: asyncio.Task | None = None  # Disconnect in progress
+
+        # Set from the voice thread when a track ends; the loop then starts the next one
+        self._playback_task: asyncio.Task | None = None
+        self._track_done = asyncio.Event()
+        # Set to "playing" before a track's stream is resolved and kept there while the
+        # loop switches tracks, so a concurrent /play can't start a second one
+        self._state: Literal["idle", "playing", "paused"] = "idle"
+
+        # Next track's source, started while the current track is still playing
+        self._next_track: Track | None = None
+        self._next_source: YTDLPAudioSource | None = None
+        self._prefetch_tasks: set[asyncio.Task] = set()
 
     async def play_next(self, *, notify: bool = True) -> Track | None:
         """Play the next track in the queue. Returns the track or None if queue empty.
 
+        Later tracks are started by the playback loop as each one finishes.
+
         Args:
             notify: If True, sends a "Now Playing" message to the text channel.
                     Set to False when the caller handles its own response.
         """
         self._cancel_idle_timer()
 
-        track = self.queue.next()
+        # Claim the player before the first await: resolving the stream takes a
+        # network round-trip, and a second /play in that window must see us busy
+        self._state = "playing"
+        try:
+            track = await self._start_next_track()
+        except Exception:
+            self._state = "idle"
+            raise
+
         if not track:
-            await self._start_idle_timer()
+            self._state = "idle"
+            self._start_idle_timer()
             return None
 
-        # Use yt-dlp piped audio source
-        source = YTDLPAudioSource(track.youtube_url)
+        # play() succeeded, so the loop must run even if the track has already ended
+        # or been paused; it picks up a _track_done set before it started
+        if not self._playback_task or self._playback_task.done():
+            self._playback_task = asyncio.create_task(self._playback_loop())
+
+        if notify:
+            await self._announce(track)
+        return track
+
+    async def _playback_loop(self) -> None:
+        """Start each track after the previous one finishes, until the queue runs dry."""
+        while True:
+            await self._track_done.wait()
+            try:
+                track = await self._start_next_track()
+                if track:
+                    await self._announce(track)
+            except Exception as e:
+                # One bad track must not stall the rest of the queue
+                print(f"Player error: {e}")
+                if not self.voice_client.is_connected():
+                    self._state = "idle"
+                    return
+                continue
+
+            if not track:
+                self._state = "idle"
+                self._start_idle_timer()
+                return
+
+    async def _start_next_track(self) -> Track | None:
+        """Pop the next loadable track and start playing it. Returns None if queue empty
+        or the voice connection is gone.
+
+        Nothing is awaited once play() succeeds, so callers can act on the result
+        before the track can end or be paused.
+        """
+        # Skip past tracks whose audio can't be loaded
+        while True:
+            # Don't pop tracks or start decoders we can't play
+            if not self.voice_client.is_connected():
+                self._cancel_prefetch()
+                return None
+
+            track = self.queue.next()
+            if not track:
+                self._cancel_prefetch()  # e.g. /clear after the next track was prefetched
+                return None
+
+            source = self._take_prefetched(track) or await self._create_source(track)
+            if source:
+                break
+
+        loop = self.voice_client.loop
 
         def after_callback(error: Exception | None):
             if error:
                 print(f"Player error: {error}")
-            # Schedule play_next on the event loop (always notify on auto-advance)
-            asyncio.run_coroutine_threadsafe(
-                self.play_next(), self.voice_client.loop
-            )
+            if source.error:
+                # Don't keep handing out a stream URL that just failed
+                self.youtube.invalidate(track.youtube_url)
+                print(f"Stream failed for {track.youtube_url}: {source.error}")
+            # Runs on discord.py's audio thread; wake the playback loop
+            loop.call_soon_threadsafe(self._track_done.set)
 
-        self.voice_client.play(source, after=after_callback)
+        try:
+            self.voice_client.play(source, after=after_callback)
+        except Exception:
+            source.cleanup()  # Never handed to discord.py, so nothing else will
+            raise
+        # Only once play() succeeded: if it raised, the loop must move on rather than
+        # wait for an after callback that will never come. The callback can't set
+        # the event before this runs, since it goes through call_soon_threadsafe.
+        self._track_done.clear()
+        self._state = "playing"
+        self._schedule_prefetch(track)
 
         if self.on_track_start:
             self.on_track_start(track)
 
-        # Send "Now Playing" notification if enabled
-        if notify and self.text_channel:
+        return track
+
+    async def _announce(self, track: Track) -> None:
+        """Send a "Now Playing" message to the text channel, if there is one."""
+        if self.text_channel:
             await self.text_channel.send(embed=now_playing_embed(track))
 
-        return track
+    async def _create_source(self, track: Track) -> YTDLPAudioSource | None:
+        """Resolve a track's stream URL and start decoding it. Returns None on failure."""
+        audio = await self.youtube.aget_audio_source(track.youtube_url)
+        if not audio:
+            print(f"Could not load audio for: {track.youtube_url}")
+            return None
+
+        return YTDLPAudioSource(audio)
+
+    def _schedule_prefetch(self, current: Track) -> None:
+        """Start preparing the track after `current` in the background."""
+        task = asyncio.create_task(self._prefetch_next(current))
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._prefetch_tasks.discard)
+
+    async def _prefetch_next(self, current: Track) -> None:
+        """Resolve the next track's stream now, then start decoding it shortly before
+        `current` ends so playback can switch over without a gap."""
+        track = self.queue.peek()
+        if not track:
+            return
+
+        # Resolve now and keep the result: stream URLs stay valid for hours, but
+        # YouTubeClient's info cache may have expired by the time `current` ends
+        audio = await self.youtube.aget_audio_source(track.youtube_url)
+        if not audio:
+            return  # _start_next_track will retry and report it
+
+        remaining = current.duration_ms / 1000 - PREFETCH_LEAD_SECONDS
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
+        # Queue may have been cleared or reshuffled while we waited
+        if self.queue.peek() is not track:
+            return
+
+        if self._next_source:
+            self._next_source.cleanup()
+        self._next_track = track
+        self._next_source = YTDLPAudioSource(audio)
+
+    def _take_prefetched(self, track: Track) -> YTDLPAudioSource | None:
+        """Return the prefetched source if it belongs to `track`, discarding it otherwise."""
+        source = None
+        if self._next_track is track and not self._next_source.stalled:
+            source, self._next_source = self._next_source, None
+        self._cancel_prefetch()
+        return source
+
+    def _cancel_prefetch(self) -> None:
+        """Cancel pending prefetches and clean up an unused prefetched source."""
+        for task in self._prefetch_tasks:
+            task.cancel()
+        if self._next_source:
+            self._next_source.cleanup()
+        self._next_source = None
+        self._next_track = None
 
     def pause(self) -> bool:
         """Pause playback. Returns True if successful."""
         if self.voice_client.is_playing():
             self.voice_client.pause()
+            self._state = "paused"
             return True
         return False
 
@@ -224,17 +564,23 @@ class Player:
         """Resume playback. Returns True if successful."""
         if self.voice_client.is_paused():
             self.voice_client.resume()
+            self._state = "playing"
             return True
         return False
 
     def skip(self) -> None:
         """Skip the current track."""
-        if self.voice_client.is_playing() or self.voice_client.is_paused():
+        if self._state != "idle":
             self.voice_client.stop()  # This triggers the after callback
 
     async def stop(self) -> None:
         """Stop playback and disconnect."""
         self._cancel_idle_timer()
+        if self._playback_task and self._playback_task is not asyncio.current_task():
+            self._playback_task.cancel()
+        self._playback_task = None
+        self._state = "idle"
+        self._cancel_prefetch()
         self.queue.clear()
         self.queue.current = None
         if self.voice_client.is_connected():
@@ -243,33 +589,57 @@ class Player:
             self.on_disconnect()
 
     def is_playing(self) -> bool:
-        """Check if currently playing or paused."""
-        return self.voice_client.is_playing() or self.voice_client.is_paused()
+        """Check if currently playing or paused, or between two tracks."""
+        return self._state != "idle"
 
-    async def _start_idle_timer(self) -> None:
+    def _start_idle_timer(self) -> None:
         """Start the idle disconnect timer."""
-        self._idle_task = asyncio.create_task(self._idle_disconnect())
+        self._cancel_idle_timer()
+        self._idle_handle = self.voice_client.loop.call_later(
+            IDLE_TIMEOUT_SECONDS, self._on_idle_timeout
+        )
 
-    def _cancel_idle_timer(self) -> None:
-        """Cancel the idle disconnect timer if running."""
-        if self._idle_task and not self._idle_task.done():
-            self._idle_task.cancel()
+    def _on_idle_timeout(self) -> None:
+        """Timer callback: run the disconnect, keeping the task referenced until done."""
+        self._idle_handle = None
+        task = asyncio.create_task(self._idle_disconnect())
+        self._idle_task = task
+        task.add_done_callback(self._clear_idle_task)
+
+    def _clear_idle_task(self, task: asyncio.Task) -> None:
+        """Done callback: drop the reference once the disconnect finishes."""
+        if self._idle_task is task:
             self._idle_task = None
 
+    def _cancel_idle_timer(self) -> None:
+        """Cancel the idle disconnect timer if it hasn't fired yet."""
+        if self._idle_handle:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+
     async def _idle_disconnect(self) -> None:
         """Disconnect after idle timeout."""
-        await asyncio.sleep(IDLE_TIMEOUT_SECONDS)
         if self.voice_client.is_connected() and not self.is_playing():
+            self._cancel_prefetch()
             await self.voice_client.disconnect()
             if self.on_disconnect:
                 self.on_disconnect()
 
 
 class PlayerManager:
-    """Manages players for all guilds."""
+    """Manages players for all guilds.
+
+    Players are looked up through a WeakValueDictionary and kept alive only by
+    the _strong set, so dropping a player from the set is enough to release it.
+    A periodic sweep evicts players whose voice connection went away without
+    on_disconnect firing.
+    """
+
+    SWEEP_INTERVAL_SECONDS = 60
 
     def __init__(self, youtube: YouTubeClient):
-        self._players: dict[int, Player] = {}
+        self._players: weakref.WeakValueDictionary[int, Player] = weakref.WeakValueDictionary()
+        self._strong: set[Player] = set()
         self._youtube = youtube
 
     def create(
@@ -290,7 +660,9 @@ class PlayerManager:
             on_track_start=on_track_start,
             on_disconnect=on_disconnect,
         )
+        self.remove(guild_id)
         self._players[guild_id] = player
+        self._strong.add(player)
         return player
 
     def get(self, guild_id: int) -> Player | None:
@@ -299,4 +671,28 @@ class PlayerManager:
 
     def remove(self, guild_id: int) -> None:
         """Remove a player for a guild."""
-        self._players.pop(guild_id, None)
+        player = self._players.pop(guild_id, None)
+        if player:
+            self._strong.discard(player)
+
+    async def sweep_forever(self) -> None:
+        """Periodically evict players whose voice client is no longer connected.
+
+        A player is only evicted after failing two sweeps in a row, so a voice
+        client that is briefly reconnecting isn't torn down.
+        """
+        suspects: set[int] = set()
+        while True:
+            await asyncio.sleep(self.SWEEP_INTERVAL_SECONDS)
+            disconnected = {
+                guild_id
+                for guild_id, player in list(self._players.items())
+                if not player.voice_client.is_connected()
+            }
+            for guild_id in disconnected & suspects:
+                player = self._players.get(guild_id)
+                if player:
+                    print(f"Evicting stale player for guild {guild_id}")
+                    await player.stop()  # Runs on_disconnect, which normally removes it
+                    self.remove(guild_id)
+            suspects = disconnected
@@ -1,53 +1,135 @@
-import random
-from collections import deque
+from typing import TYPE_CHECKING
 
-from src.models.track import Track
+if TYPE_CHECKING:
+    from src.models.track import Track
 
+MAX_QUEUE_SIZE = 1000  # Pending tracks per guild
+COMPACT_AFTER = 128  # Consumed tracks kept before the list is compacted
+SAMPLE_TRIES_MAX = 4  # Fair shuffle scans instead of sampling when more tries are expected
 
-class GuildQueue:
-    """Queue for a single guild's music playback."""
 
-    def __init__(self):
-        self._queue: deque[Track] = deque()
+class QueueFullError(Exception):
+    """Raised by GuildQueue.add() when the queue is at max_size."""
+
+
+class GuildQueue:
+    """Queue for a single guild's music playback.
+
+    Pending tracks are `_queue[_head:]`. Taking the next track just advances
+    `_head`, and the consumed prefix is dropped once it outgrows the rest, so
+    pops from the front are amortized O(1). A shuffle pick is O(n): the chosen
+    track is shifted to the front to keep the rest in order, and fair shuffle
+    either samples a few random indices or, when another requester's tracks are
+    scarce, scans the queue once.
+    """
+
+    def __init__(self, max_size: int = MAX_QUEUE_SIZE):
+        self.max_size = max_size
+        self._queue: list[Track] = []
+        self._head = 0
+        self._requester_counts: dict[str | None, int] = {}  # Pending tracks per requester
         self.current: Track | None = None
         self.shuffle: bool = False
+        self._next_pinned = False  # Front track was already chosen by peek()
 
     def add(self, track: Track) -> int:
-        """Add a track to the queue. Returns position in queue (0 = playing next)."""
+        """Add a track to the queue. Returns position in queue (0 = playing next).
+
+        Set track.requested_by before adding; fair shuffle counts tracks per requester.
+        Raises QueueFullError if max_size tracks are already pending.
+        """
+        if len(self) >= self.max_size:
+            raise QueueFullError(f"The queue is full ({self.max_size} tracks).")
+
         self._queue.append(track)
-        return len(self._queue) - 1
+        requester = track.requested_by
+        self._requester_counts[requester] = self._requester_counts.get(requester, 0) + 1
+        return len(self) - 1
 
     def next(self) -> Track | None:
         """Get the next track from the queue. Returns None if empty."""
-        if not self._queue:
+        if self.is_empty():
             self.current = None
             return None
 
-        if self.shuffle:
-            self.current = self._pick_shuffle_track()
-        else:
-            self.current = self._queue.popleft()
+        if self.shuffle and not self._next_pinned:
+            self._move_to_front(self._pick_shuffle_index())
+        self._next_pinned = False
 
+        self.current = self._pop_front()
         return self.current
 
-    def _pick_shuffle_track(self) -> Track:
-        """Pick next track using fair shuffle: alternate requesters when possible."""
-        prev_requester = self.current.requested_by if self.current else None
+    def peek(self) -> Track | None:
+        """Get the track next() will return, without removing it. Returns None if empty.
+
+        In shuffle mode the pick is made now and moved to the front of the queue,
+        so a later next() returns the same track.
+        """
+        if self.is_empty():
+            return None
+
+        if self.shuffle and not self._next_pinned:
+            self._move_to_front(self._pick_shuffle_index())
+            self._next_pinned = True
 
-        # Find tracks from other requesters
-        other_indices = [
-            i for i, t in enumerate(self._queue)
-            if t.requested_by != prev_requester
-        ]
+        return self._queue[self._head]
 
-        if other_indices:
-            idx = random.choice(other_indices)
+    def _pick_shuffle_index(self) -> int:
+        """Pick next track using fair shuffle: alternate requesters when possible."""
+        import random  # Only needed once shuffle is on; keeps it off the import path
+
+        prev_requester = self.current.requested_by if self.current else None
+        size = len(self)
+        others = size - self._requester_counts.get(prev_requester, 0)
+
+        if others == 0 or others == size:
+            # All tracks are from the same requester (or none from the last one)
+            return self._head + random.randrange(size)
+
+        if others * SAMPLE_TRIES_MAX < size:
+            # Few eligible tracks (e.g. one song after someone's playlist): sampling
+            # would take size / others tries, so one scan is cheaper
+            pending = self._queue[self._head:]
+            candidates = [
+                idx
+                for idx, track in enumerate(pending, self._head)
+                if track.requested_by != prev_requester
+            ]
+            return random.choice(candidates)
+
+        # Sample until we hit another requester's track: uniform over those tracks,
+        # and at most SAMPLE_TRIES_MAX tries on average instead of a full scan
+        while True:
+            idx = self._head + random.randrange(size)
+            if self._queue[idx].requested_by != prev_requester:
+                return idx
+
+    def _move_to_front(self, idx: int) -> None:
+        """Move the track at idx into the front slot, keeping the rest in order.
+
+        A swap would be cheaper, but it would leave the queue permanently reordered
+        after shuffle is turned off. Shifting at most max_size pointers is cheap.
+        """
+        if idx != self._head:
+            self._queue.insert(self._head, self._queue.pop(idx))
+
+    def _pop_front(self) -> Track:
+        """Remove and return the front track."""
+        track = self._queue[self._head]
+        self._head += 1
+
+        requester = track.requested_by
+        remaining = self._requester_counts[requester] - 1
+        if remaining:
+            self._requester_counts[requester] = remaining
         else:
-            # All tracks are from the same requester, pick randomly
-            idx = random.randrange(len(self._queue))
+            del self._requester_counts[requester]
+
+        # Drop the consumed prefix once it's larger than what's left, or just large
+        if self._head > COMPACT_AFTER or self._head * 2 > len(self._queue):
+            del self._queue[:self._head]
+            self._head = 0
 
-        track = self._queue[idx]
-        del self._queue[idx]
         return track
 
     def skip(self) -> Track | None:
@@ -57,17 +139,20 @@ class GuildQueue:
     def clear(self) -> None:
         """Clear all tracks from the queue (keeps current track playing)."""
         self._queue.clear()
+        self._head = 0
+        self._requester_counts.clear()
+        self._next_pinned = False
 
     def get_list(self) -> list[Track]:
         """Get a copy of the queue as a list."""
-        return list(self._queue)
+        return self._queue[self._head:]
 
     def is_empty(self) -> bool:
         """Check if the queue is empty."""
-        return len(self._queue) == 0
+        return len(self._queue) == self._head
 
     def __len__(self) -> int:
-        return len(self._queue)
+        return len(self._queue) - self._head
 
 
 class QueueManager:
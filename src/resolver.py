@@ -1,11 +1,48 @@
-from typing import Iterator
-
+import asyncio
+import dataclasses
+import itertools
+import re
+import sys
+from concurrent.futures import Executor
+from enum import IntEnum
+from typing import Callable, Iterator
+
+from src.cache import TTLCache
 from src.clients.spotify_scraper import SpotifyScraperClient
 from src.clients.youtube import YouTubeClient
 from src.clients.ytmusic import YTMusicClient
 from src.models.track import Track
 
 MAX_PLAYLIST_TRACKS = 500
+TRACK_CACHE_TTL_SECONDS = 30 * 60
+TRACK_CACHE_SIZE = 4096
+
+
+class InputType(IntEnum):
+    """What kind of query was passed to Resolver.resolve()."""
+
+    SEARCH = 0
+    YOUTUBE_PLAYLIST = 1
+    YOUTUBE_VIDEO = 2
+    SPOTIFY_TRACK = 3
+    SPOTIFY_PLAYLIST = 4
+
+
+# One pass over the query; the matching group's number is its InputType.
+# YT Music URLs work as regular YT videos, except YT Music playlists.
+_INPUT_TYPE_RE = re.compile(
+    r"(youtube\.com/playlist)"
+    r"|(youtube\.com/watch|youtu\.be/|music\.youtube\.com(?!/playlist))"
+    r"|(open\.spotify\.com/track|spotify:track:)"
+    r"|(open\.spotify\.com/playlist|spotify:playlist:)"
+)
+
+
+def _album_art_url(track_info: dict) -> str | None:
+    """Return the largest album image URL from a Spotify track dict, if any."""
+    # Spotify sorts album images largest first
+    images = (track_info.get("album") or {}).get("images") or []
+    return images[0].get("url") if images else None
 
 
 class Resolver:
@@ -16,53 +53,73 @@ class Resolver:
         ytmusic: YTMusicClient,
         youtube: YouTubeClient,
         spotify: SpotifyScraperClient,
+        executor: Executor | None = None,
     ):
         self.ytmusic = ytmusic
         self.youtube = youtube
         self.spotify = spotify
+        self.executor = executor  # Used by aresolve(); None means the loop's default
+        # Resolved tracks by normalized query, URL or Spotify ID
+        self._track_cache: TTLCache[str, Track] = TTLCache(
+            TRACK_CACHE_TTL_SECONDS, TRACK_CACHE_SIZE
+        )
 
-    def resolve(self, query: str) -> list[Track]:
+    def resolve(self, query: str) -> Iterator[Track]:
         """
-        Resolve a query to a list of tracks.
+        Resolve a query to an iterator of tracks.
 
         Supports:
         - Natural language search (e.g., "never gonna give you up")
         - YouTube video URLs
         - YouTube Music URLs
         - Spotify track URLs
+        - YouTube and Spotify playlist URLs
 
-        Returns list (even for single track) to support playlists in future.
+        Playlists are resolved lazily, one track per next(), so callers can queue
+        the first track before the rest are looked up.
         Raises ValueError if the query cannot be resolved.
         Raises NotImplementedError for unsupported playlist types.
         """
-        input_type = self._detect_input_type(query)
-
-        if input_type == "youtube_video":
-            return [self._resolve_youtube_video(query)]
-        elif input_type == "youtube_playlist":
-            return self._resolve_youtube_playlist(query)
-        elif input_type == "spotify_track":
-            return [self._resolve_spotify_track(query)]
-        elif input_type == "spotify_playlist":
-            return self._resolve_spotify_playlist(query)
-        else:
-            return [self._resolve_search(query)]
-
-    def _detect_input_type(self, query: str) -> str:
+        return self._HANDLERS[self.detect_input_type(query)](self, query)
+
+    async def aresolve(self, query: str) -> list[Track]:
+        """
+        Async version of resolve() for use inside the event loop.
+
+        Every flow is a chain of dependent network calls (e.g. the YouTube Music
+        search needs the Spotify title first), so the whole chain runs on the
+        executor rather than blocking the loop. Collects the whole result; stream
+        playlists through the iter_* methods instead.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, lambda: list(self.resolve(query))
+        )
+
+    def detect_input_type(self, query: str) -> InputType:
         """Detect what type of input the query is."""
-        if "youtube.com/playlist" in query:
-            return "youtube_playlist"
-        if "youtube.com/watch" in query or "youtu.be/" in query:
-            return "youtube_video"
-        if "music.youtube.com" in query:
-            return "youtube_video"  # YT Music URLs work as regular YT
-        if "open.spotify.com/track" in query or "spotify:track:" in query:
-            return "spotify_track"
-        if "open.spotify.com/playlist" in query or "spotify:playlist:" in query:
-            return "spotify_playlist"
-        return "search"
+        match = _INPUT_TYPE_RE.search(query)
+        return InputType(match.lastindex) if match else InputType.SEARCH
+
+    def _cached(self, key: str, build: Callable[[], Track]) -> Track:
+        """
+        Return a copy of the cached track for key, building it on a miss.
+
+        Copies because callers set requested_by on the track they queue.
+        """
+        track = self._track_cache.get(key)
+        if track is None:
+            track = build()
+            self._track_cache.set(key, track)
+        return dataclasses.replace(track)
 
     def _resolve_search(self, query: str) -> Track:
+        return self._cached(
+            f"search:{query.casefold().strip()}",
+            lambda: self._search_track(query),
+        )
+
+    def _search_track(self, query: str) -> Track:
         """
         Flow 1: Natural language → ytmusicapi → Track with youtube_url
 
@@ -81,9 +138,13 @@ class Resolver:
             album_art_url=metadata.album_art_url,
             youtube_url=f"https://www.youtube.com/watch?v={video_id}",
             source_url=metadata.source_url,
+            source_label="YT Music",
         )
 
     def _resolve_youtube_video(self, url: str) -> Track:
+        return self._cached(url, lambda: self._load_youtube_video(url))
+
+    def _load_youtube_video(self, url: str) -> Track:
         """
         Flow 2: YouTube URL → yt-dlp metadata → Track
 
@@ -101,9 +162,13 @@ class Resolver:
             album_art_url=metadata.album_art_url,
             youtube_url=url,
             source_url=url,
+            source_label="YouTube",
         )
 
     def _resolve_spotify_track(self, url: str) -> Track:
+        return self._cached(url, lambda: self._load_spotify_track(url))
+
+    def _load_spotify_track(self, url: str) -> Track:
         """
         Flow 3: Spotify URL → scraper metadata → ytmusicapi search → Track
 
@@ -116,19 +181,13 @@ class Resolver:
             raise ValueError(f"Could not load Spotify track: {url}")
 
         # Extract metadata from Spotify response
-        title = track_info.get("name", "")
-        artists = track_info.get("artists", [])
-        artist = artists[0]["name"] if artists else ""
+        # Keys can be present but null; sys.intern() only accepts str
+        title = sys.intern(track_info.get("name") or "")
+        artists = track_info.get("artists") or []
+        artist = sys.intern(artists[0].get("name") or "") if artists else ""
         duration_ms = track_info.get("duration_ms", 0)
 
-        # Get album art from album images (prefer largest)
-        album = track_info.get("album", {})
-        images = album.get("images", [])
-        # Images are usually sorted by size desc, but let's find largest
-        album_art = None
-        if images:
-            largest = max(images, key=lambda i: i.get("width", 0) * i.get("height", 0))
-            album_art = largest.get("url")
+        album_art = _album_art_url(track_info)
 
         # Search ytmusicapi to get YouTube video
         search_query = f"{title} {artist}"
@@ -145,27 +204,29 @@ class Resolver:
             album_art_url=album_art,
             youtube_url=f"https://www.youtube.com/watch?v={video_id}",
             source_url=url,
+            source_label="Spotify",
         )
 
-    def _resolve_youtube_playlist(self, url: str) -> list[Track]:
-        """Resolve YouTube playlist to list of tracks."""
-        return list(self.iter_youtube_playlist(url))
-
-    def _resolve_spotify_playlist(self, url: str) -> list[Track]:
-        """Resolve Spotify playlist to list of tracks."""
-        return list(self.iter_spotify_playlist(url))
-
     def iter_spotify_playlist(self, url: str) -> Iterator[Track]:
         """Yield tracks from Spotify playlist one at a time."""
+        for track_info in self.iter_spotify_playlist_info(url):
+            try:
+                yield self.spotify_track_info_to_track(track_info, url)
+            except ValueError:
+                continue  # Skip tracks that can't be resolved
+
+    def iter_spotify_playlist_info(self, url: str) -> Iterator[dict]:
+        """
+        Yield raw Spotify track dicts from a playlist without resolving them.
+
+        Pass each dict to spotify_track_info_to_track() to find it on YouTube;
+        callers can fan those lookups out concurrently.
+        """
         playlist_tracks = self.spotify.get_playlist_tracks(url)
         if not playlist_tracks:
             raise ValueError(f"Could not load Spotify playlist: {url}")
 
-        for track_info in playlist_tracks[:MAX_PLAYLIST_TRACKS]:
-            try:
-                yield self._spotify_track_info_to_track(track_info, url)
-            except ValueError:
-                continue  # Skip tracks that can't be resolved
+        yield from itertools.islice(playlist_tracks, MAX_PLAYLIST_TRACKS)
 
     def iter_youtube_playlist(self, url: str) -> Iterator[Track]:
         """Yield tracks from YouTube playlist one at a time."""
@@ -173,7 +234,7 @@ class Resolver:
         if not entries:
             raise ValueError(f"Could not load YouTube playlist: {url}")
 
-        for entry in entries[:MAX_PLAYLIST_TRACKS]:
+        for entry in itertools.islice(entries, MAX_PLAYLIST_TRACKS):
             video_id = entry.get("id")
             if not video_id:
                 continue
@@ -184,13 +245,26 @@ class Resolver:
                 album_art_url=None,
                 youtube_url=f"https://www.youtube.com/watch?v={video_id}",
                 source_url=url,
+                source_label="Playlist",
             )
 
-    def _spotify_track_info_to_track(self, track_info: dict, source_url: str) -> Track:
+    def spotify_track_info_to_track(self, track_info: dict, source_url: str) -> Track:
         """Convert Spotify track dict to Track by searching YTMusic."""
-        title = track_info.get("name", "")
-        artists = track_info.get("artists", [])
-        artist = artists[0]["name"] if artists else ""
+        track_id = track_info.get("id")
+        if not track_id:
+            return self._spotify_info_to_track(track_info, source_url)
+        track = self._cached(
+            f"spotify:{track_id}",
+            lambda: self._spotify_info_to_track(track_info, source_url),
+        )
+        track.source_url = source_url
+        return track
+
+    def _spotify_info_to_track(self, track_info: dict, source_url: str) -> Track:
+        # Keys can be present but null; sys.intern() only accepts str
+        title = sys.intern(track_info.get("name") or "")
+        artists = track_info.get("artists") or []
+        artist = sys.intern(artists[0].get("name") or "") if artists else ""
         duration_ms = track_info.get("duration_ms", 0)
 
         result = self.ytmusic.search_track(f"{title} {artist}")
@@ -202,7 +276,17 @@ class Resolver:
             title=title,
             artist=artist,
             duration_ms=duration_ms,
-            album_art_url=metadata.album_art_url,
+            # Playlist entries usually lack album art; fall back to YT Music's
+            album_art_url=_album_art_url(track_info) or metadata.album_art_url,
             youtube_url=f"https://www.youtube.com/watch?v={video_id}",
             source_url=source_url,
+            source_label="Spotify",
         )
+
+    _HANDLERS: dict[InputType, Callable[["Resolver", str], Iterator[Track]]] = {
+        InputType.SEARCH: lambda self, query: iter([self._resolve_search(query)]),
+        InputType.YOUTUBE_PLAYLIST: iter_youtube_playlist,
+        InputType.YOUTUBE_VIDEO: lambda self, query: iter([self._resolve_youtube_video(query)]),
+        InputType.SPOTIFY_TRACK: lambda self, query: iter([self._resolve_spotify_track(query)]),
+        InputType.SPOTIFY_PLAYLIST: iter_spotify_playlist,
+    }
@@ -18,16 +18,9 @@ def now_playing_embed(track: Track) -> discord.Embed:
 
     # Build links based on available URLs
     if track.source_url and track.source_url != track.youtube_url:
-        # Determine source label based on URL
-        if "spotify" in track.source_url:
-            source_label = "Spotify"
-        elif "music.youtube.com" in track.source_url:
-            source_label = "YT Music"
-        else:
-            source_label = "Source"
         embed.add_field(
             name="Links",
-            value=f"[{source_label}]({track.source_url}) | [YouTube]({track.youtube_url})",
+            value=f"[{track.source_label}]({track.source_url}) | [YouTube]({track.youtube_url})",
             inline=False,
         )
     else:
@@ -68,14 +61,13 @@ def queue_embed(tracks: list[Track], current: Track | None) -> discord.Embed:
     if current:
         embed.add_field(
             name="Now Playing",
-            value=f"**{current.title}** by {current.artist} [{current.duration_str}]",
+            value=current.queue_line,
             inline=False,
         )
 
     if tracks:
         queue_text = "\n".join(
-            f"`{i + 1}.` **{t.title}** by {t.artist} [{t.duration_str}]"
-            for i, t in enumerate(tracks[:10])  # Show max 10 tracks
+            [f"`{i}.` {t.queue_line}" for i, t in enumerate(tracks[:10], 1)]  # Show max 10 tracks
         )
         if len(tracks) > 10:
             queue_text += f"\n\n*...and {len(tracks) - 10} more*"
@@ -97,14 +89,20 @@ def error_embed(message: str) -> discord.Embed:
     )
 
 
-def playlist_added_embed(tracks: list[Track], failed_count: int = 0) -> discord.Embed:
-    """Embed for playlist added to queue."""
+def playlist_added_embed(
+    tracks: list[Track], failed_count: int = 0, *, offset: int = 0
+) -> discord.Embed:
+    """Embed for playlist tracks added to queue.
+
+    `offset` is the number of playlist tracks already reported, so batches
+    sent while a playlist streams in keep their playlist numbering.
+    """
     desc = f"**{len(tracks)} tracks** added to queue"
     if failed_count > 0:
         desc += f" ({failed_count} could not be resolved)"
 
     embed = discord.Embed(
-        title="Playlist Loaded",
+        title="Playlist Tracks Added",
         description=desc,
         color=discord.Color.blue(),
     )
@@ -115,7 +113,9 @@ def playlist_added_embed(tracks: list[Track], failed_count: int = 0) -> discord.
     embed.add_field(name="Duration", value=f"{minutes}m", inline=True)
 
     # Preview first 5 tracks
-    preview = "\n".join(f"`{i+1}.` {t.title}" for i, t in enumerate(tracks[:5]))
+    preview = "\n".join(
+        f"`{offset + i + 1}.` {t.title}" for i, t in enumerate(tracks[:5])
+    )
     if len(tracks) > 5:
         preview += f"\n*...and {len(tracks) - 5} more*"
     embed.add_field(name="Tracks", value=preview, inline=False)